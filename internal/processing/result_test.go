@@ -0,0 +1,62 @@
+package processing
+
+import (
+	"context"
+	"testing"
+
+	"github.com/RMahshie/sonara/internal/repository"
+	"github.com/RMahshie/sonara/pkg/models"
+	"github.com/google/uuid"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/mock"
+	"github.com/stretchr/testify/require"
+)
+
+// mockResultRepository records UpdateError calls; the embedded interface is nil,
+// so any other repository call made while parsing results fails the test
+type mockResultRepository struct {
+	repository.AnalysisRepository
+	mock.Mock
+}
+
+func (m *mockResultRepository) UpdateError(ctx context.Context, id uuid.UUID, errorMsg string) error {
+	args := m.Called(ctx, id, errorMsg)
+	return args.Error(0)
+}
+
+func TestParseAnalysisResult_ColumnarArrays(t *testing.T) {
+	repo := new(mockResultRepository)
+	service := &processingService{repository: repo}
+	analysisID := uuid.New()
+
+	data := []byte(`{"frequencies":[20.0,1000.0,20000.0],"magnitudes":[-3.5,0.0,-12.25],"rt60":0.4,"room_modes":[]}`)
+
+	result, err := service.parseAnalysisResult(context.Background(), analysisID, data)
+
+	require.NoError(t, err)
+	assert.Equal(t, []models.FrequencyPoint{
+		{Frequency: 20.0, Magnitude: -3.5},
+		{Frequency: 1000.0, Magnitude: 0.0},
+		{Frequency: 20000.0, Magnitude: -12.25},
+	}, result.FrequencyData)
+	assert.Equal(t, 0.4, result.RT60)
+	repo.AssertNotCalled(t, "UpdateError", mock.Anything, mock.Anything, mock.Anything)
+}
+
+func TestParseAnalysisResult_MismatchedArrays(t *testing.T) {
+	repo := new(mockResultRepository)
+	service := &processingService{repository: repo}
+	analysisID := uuid.New()
+	ctx := context.Background()
+
+	repo.On("UpdateError", ctx, analysisID, "mismatched result arrays: 2 frequencies, 1 magnitudes").Return(nil)
+
+	data := []byte(`{"frequencies":[20.0,1000.0],"magnitudes":[-3.5],"rt60":0.4}`)
+
+	result, err := service.parseAnalysisResult(ctx, analysisID, data)
+
+	assert.Error(t, err)
+	assert.Contains(t, err.Error(), "mismatched result arrays")
+	assert.Nil(t, result)
+	repo.AssertExpectations(t)
+}
@@ -27,6 +27,7 @@ type processingService struct {
 	repository repository.AnalysisRepository
 	pythonPath string   // Absolute path to "scripts/analyze_audio.py"
 	pythonArgs []string // Python command arguments (for Docker or direct execution)
+	worker     *analysisWorker
 }
 
 func NewProcessingService(s3Service storage.S3Service, repo repository.AnalysisRepository, cfg *config.Config, scriptPath string) ProcessingService {
@@ -44,9 +45,23 @@ func NewProcessingService(s3Service storage.S3Service, repo repository.AnalysisR
 		repository: repo,
 		pythonPath: scriptPath, // Store the script path for reference
 		pythonArgs: pythonArgs,
+		worker:     newAnalysisWorker(serveCommand(pythonArgs)),
 	}
 }
 
+// serveCommand turns the analyzer command into its long-lived "--serve" form.
+// "docker exec" needs -i to keep the worker's stdin attached.
+func serveCommand(pythonArgs []string) []string {
+	args := make([]string, 0, len(pythonArgs)+2)
+	for i, arg := range pythonArgs {
+		args = append(args, arg)
+		if arg == "exec" && i > 0 && pythonArgs[i-1] == "docker" && (i+1 >= len(pythonArgs) || pythonArgs[i+1] != "-i") {
+			args = append(args, "-i")
+		}
+	}
+	return append(args, "--serve")
+}
+
 // parsePythonCommand parses a PYTHON_CMD string into command arguments
 // Examples:
 //
@@ -62,6 +77,49 @@ func parsePythonCommand(pythonCmd string) []string {
 	return strings.Fields(pythonCmd)
 }
 
+// analysisResult is the JSON document written by analyze_audio.py
+type analysisResult struct {
+	FrequencyData []models.FrequencyPoint `json:"frequency_data"`
+	Frequencies   []float64               `json:"frequencies"` // Columnar format
+	Magnitudes    []float64               `json:"magnitudes"`
+	RT60          float64                 `json:"rt60"`
+	RoomModes     interface{}             `json:"room_modes"` // Can be []float64 or enhanced format
+	Error         string                  `json:"error,omitempty"`
+}
+
+// parseAnalysisResult decodes the analyzer output and rebuilds FrequencyData from the
+// columnar frequencies/magnitudes arrays. Analyzer errors and mismatched arrays mark
+// the analysis as failed.
+func (s *processingService) parseAnalysisResult(ctx context.Context, analysisID uuid.UUID, resultData []byte) (*analysisResult, error) {
+	var result analysisResult
+	if err := json.Unmarshal(resultData, &result); err != nil {
+		log.Error().Str("analysisID", analysisID.String()).Err(err).Msg("Failed to parse JSON results")
+		return nil, fmt.Errorf("failed to parse results: %w", err)
+	}
+
+	if result.Error != "" {
+		log.Error().Str("analysisID", analysisID.String()).Str("error", result.Error).Msg("Python script reported error")
+		s.repository.UpdateError(ctx, analysisID, result.Error)
+		return nil, fmt.Errorf("analysis error: %s", result.Error)
+	}
+
+	// Rebuild frequency points from the columnar arrays
+	if len(result.FrequencyData) == 0 && len(result.Frequencies) > 0 {
+		if len(result.Frequencies) != len(result.Magnitudes) {
+			errMsg := fmt.Sprintf("mismatched result arrays: %d frequencies, %d magnitudes", len(result.Frequencies), len(result.Magnitudes))
+			log.Error().Str("analysisID", analysisID.String()).Msg(errMsg)
+			s.repository.UpdateError(ctx, analysisID, errMsg)
+			return nil, fmt.Errorf("failed to parse results: %s", errMsg)
+		}
+		result.FrequencyData = make([]models.FrequencyPoint, len(result.Frequencies))
+		for i, freq := range result.Frequencies {
+			result.FrequencyData[i] = models.FrequencyPoint{Frequency: freq, Magnitude: result.Magnitudes[i]}
+		}
+	}
+
+	return &result, nil
+}
+
 func (s *processingService) ProcessAnalysis(ctx context.Context, analysisID uuid.UUID) error {
 	log.Info().Str("analysisID", analysisID.String()).Msg("Starting audio processing pipeline")
 
@@ -161,47 +219,39 @@ func (s *processingService) ProcessAnalysis(ctx context.Context, analysisID uuid
 	resultFile := filepath.Join("/tmp", fmt.Sprintf("%s.result.json", analysisID))
 	defer os.Remove(resultFile) // GUARANTEED cleanup
 
-	// Prepare room data JSON for Python script
-	var roomDataJSON string
+	// Prepare room data for the Python worker
+	var roomData map[string]float64
 	if roomDims != nil && (roomDims.LengthFeet > 0 || roomDims.WidthFeet > 0 || roomDims.HeightFeet > 0) {
-		roomData := map[string]float64{
+		roomData = map[string]float64{
 			"room_length_feet": roomDims.LengthFeet,
 			"room_width_feet":  roomDims.WidthFeet,
 			"room_height_feet": roomDims.HeightFeet,
 		}
-		roomDataBytes, err := json.Marshal(roomData)
-		if err != nil {
-			log.Warn().Str("analysisID", analysisID.String()).Err(err).Msg("Failed to marshal room data, proceeding without it")
-		} else {
-			roomDataJSON = string(roomDataBytes)
-			log.Info().Str("analysisID", analysisID.String()).Str("roomData", roomDataJSON).Msg("Room dimensions found, will pass to Python script")
-		}
+		log.Info().Str("analysisID", analysisID.String()).Interface("roomData", roomData).Msg("Room dimensions found, will pass to Python worker")
 	} else {
 		log.Info().Str("analysisID", analysisID.String()).Msg("No room dimensions found, proceeding with basic analysis")
 	}
 
-	// Use configured python command
-	log.Info().Str("analysisID", analysisID.String()).Strs("pythonArgs", s.pythonArgs).Str("scriptPath", s.pythonPath).Str("wavFile", wavFile).Str("signalID", analysis.SignalID).Str("resultFile", resultFile).Str("roomData", roomDataJSON).Msg("Starting Python script execution")
-
-	// Pass signal ID, result file path, and room data to Python script
-	args := append(s.pythonArgs, wavFile, analysis.SignalID, resultFile)
-	if roomDataJSON != "" {
-		args = append(args, roomDataJSON)
-	}
-	cmd := exec.CommandContext(ctx, args[0], args[1:]...)
+	// Send signal ID, result file path, and room data to the persistent Python worker
+	log.Info().Str("analysisID", analysisID.String()).Strs("pythonArgs", s.worker.args).Str("scriptPath", s.pythonPath).Str("wavFile", wavFile).Str("signalID", analysis.SignalID).Str("resultFile", resultFile).Msg("Sending request to Python analysis worker")
 
 	startTime := time.Now()
-	output, err := cmd.CombinedOutput()
+	_, err = s.worker.Analyze(ctx, workerRequest{
+		RequestID:    analysisID.String(),
+		RecordedFile: wavFile,
+		SignalID:     analysis.SignalID,
+		RoomData:     roomData,
+		OutputFile:   resultFile,
+	})
 	executionTime := time.Since(startTime)
 
 	if err != nil {
-		outputStr := string(output)
-		log.Error().Str("analysisID", analysisID.String()).Dur("executionTime", executionTime).Err(err).Str("output", outputStr).Msg("Python script execution failed")
-		s.repository.UpdateError(ctx, analysisID, fmt.Sprintf("Audio analysis failed: %s", outputStr))
-		return fmt.Errorf("python analysis failed: %w, output: %s", err, outputStr)
+		log.Error().Str("analysisID", analysisID.String()).Dur("executionTime", executionTime).Err(err).Msg("Python analysis worker failed")
+		s.repository.UpdateError(ctx, analysisID, fmt.Sprintf("Audio analysis failed: %s", err))
+		return fmt.Errorf("python analysis failed: %w", err)
 	}
 
-	log.Info().Str("analysisID", analysisID.String()).Dur("executionTime", executionTime).Msg("Python script execution completed successfully")
+	log.Info().Str("analysisID", analysisID.String()).Dur("executionTime", executionTime).Msg("Python analysis completed successfully")
 
 	// Step 6: Parse results
 	log.Info().Str("analysisID", analysisID.String()).Msg("Step 6: Updating status to processing (80%)")
@@ -228,22 +278,9 @@ func (s *processingService) ProcessAnalysis(ctx context.Context, analysisID uuid
 
 	// Parse JSON from file content
 	log.Info().Str("analysisID", analysisID.String()).Msg("Parsing JSON results")
-	var result struct {
-		FrequencyData []models.FrequencyPoint `json:"frequency_data"`
-		RT60          float64                 `json:"rt60"`
-		RoomModes     interface{}             `json:"room_modes"` // Can be []float64 or enhanced format
-		Error         string                  `json:"error,omitempty"`
-	}
-
-	if err := json.Unmarshal(resultData, &result); err != nil {
-		log.Error().Str("analysisID", analysisID.String()).Err(err).Msg("Failed to parse JSON results")
-		return fmt.Errorf("failed to parse results: %w", err)
-	}
-
-	if result.Error != "" {
-		log.Error().Str("analysisID", analysisID.String()).Str("error", result.Error).Msg("Python script reported error")
-		s.repository.UpdateError(ctx, analysisID, result.Error)
-		return fmt.Errorf("analysis error: %s", result.Error)
+	result, err := s.parseAnalysisResult(ctx, analysisID, resultData)
+	if err != nil {
+		return err
 	}
 
 	log.Info().Str("analysisID", analysisID.String()).Int("frequencyPoints", len(result.FrequencyData)).Float64("rt60", result.RT60).Msg("Results parsed successfully")
@@ -0,0 +1,140 @@
+package processing
+
+import (
+	"bufio"
+	"context"
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"os/exec"
+	"sync"
+
+	"github.com/rs/zerolog/log"
+)
+
+// workerRequest is one NDJSON request line for "analyze_audio.py --serve"
+type workerRequest struct {
+	RequestID    string             `json:"request_id"`
+	RecordedFile string             `json:"recorded_file"`
+	SignalID     string             `json:"signal_id"`
+	RoomData     map[string]float64 `json:"room_data,omitempty"`
+	OutputFile   string             `json:"output_file,omitempty"`
+}
+
+// workerResponse is the reply line the worker writes for each request
+type workerResponse struct {
+	RequestID string          `json:"request_id"`
+	Result    json.RawMessage `json:"result"`
+}
+
+// analysisWorker keeps a single "analyze_audio.py --serve" process alive so the
+// Python imports and the analyzer's cached reference data are paid for once.
+// Requests are serialized; the process is started lazily and restarted on the
+// next request after it dies or a request is cancelled.
+type analysisWorker struct {
+	args []string
+
+	mu     sync.Mutex
+	cmd    *exec.Cmd
+	stdin  io.WriteCloser
+	stdout *bufio.Reader
+}
+
+func newAnalysisWorker(args []string) *analysisWorker {
+	return &analysisWorker{args: args}
+}
+
+func (w *analysisWorker) start() error {
+	cmd := exec.Command(w.args[0], w.args[1:]...)
+	cmd.Stderr = os.Stderr // Python logs go to stderr
+
+	stdin, err := cmd.StdinPipe()
+	if err != nil {
+		return fmt.Errorf("failed to open worker stdin: %w", err)
+	}
+	stdout, err := cmd.StdoutPipe()
+	if err != nil {
+		return fmt.Errorf("failed to open worker stdout: %w", err)
+	}
+	if err := cmd.Start(); err != nil {
+		return fmt.Errorf("failed to start analysis worker: %w", err)
+	}
+
+	log.Info().Strs("pythonArgs", w.args).Int("pid", cmd.Process.Pid).Msg("Started Python analysis worker")
+	w.cmd = cmd
+	w.stdin = stdin
+	w.stdout = bufio.NewReader(stdout)
+	return nil
+}
+
+// stop kills the worker process; the next request starts a fresh one
+func (w *analysisWorker) stop() {
+	if w.cmd == nil {
+		return
+	}
+	w.stdin.Close()
+	w.cmd.Process.Kill()
+	w.cmd.Wait()
+	w.cmd, w.stdin, w.stdout = nil, nil, nil
+}
+
+// Analyze sends one request to the worker and returns the raw "result" object of its reply
+func (w *analysisWorker) Analyze(ctx context.Context, req workerRequest) (json.RawMessage, error) {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+
+	if w.cmd == nil {
+		if err := w.start(); err != nil {
+			return nil, err
+		}
+	}
+
+	line, err := json.Marshal(req)
+	if err != nil {
+		return nil, fmt.Errorf("failed to encode analysis request: %w", err)
+	}
+	if _, err := w.stdin.Write(append(line, '\n')); err != nil {
+		w.stop()
+		return nil, fmt.Errorf("failed to send analysis request: %w", err)
+	}
+
+	type reply struct {
+		line []byte
+		err  error
+	}
+	replies := make(chan reply, 1)
+	stdout := w.stdout
+	go func() {
+		line, err := stdout.ReadBytes('\n')
+		replies <- reply{line, err}
+	}()
+
+	var r reply
+	select {
+	case <-ctx.Done():
+		// Killing the process unblocks the pending read
+		w.cmd.Process.Kill()
+		<-replies
+		w.stop()
+		return nil, ctx.Err()
+	case r = <-replies:
+	}
+
+	if r.err != nil {
+		w.stop()
+		return nil, fmt.Errorf("analysis worker exited: %w", r.err)
+	}
+
+	var resp workerResponse
+	if err := json.Unmarshal(r.line, &resp); err != nil {
+		w.stop()
+		return nil, fmt.Errorf("invalid analysis worker reply: %w", err)
+	}
+	if resp.RequestID != req.RequestID {
+		w.stop()
+		return nil, fmt.Errorf("analysis worker replied to request %q, expected %q", resp.RequestID, req.RequestID)
+	}
+
+	return resp.Result, nil
+}
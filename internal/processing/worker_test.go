@@ -0,0 +1,75 @@
+package processing
+
+import (
+	"context"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// echoWorker answers every request line like "analyze_audio.py --serve" would,
+// and exits when asked to analyze "crash.wav"
+const echoWorker = `
+import json, sys
+for line in sys.stdin:
+    req = json.loads(line)
+    if req["recorded_file"] == "crash.wav":
+        sys.exit(1)
+    reply = {"request_id": req["request_id"], "result": {"signal_id": req["signal_id"], "room_data": req.get("room_data")}}
+    sys.stdout.write(json.dumps(reply) + "\n")
+    sys.stdout.flush()
+`
+
+func TestServeCommand(t *testing.T) {
+	assert.Equal(t,
+		[]string{"python3", "scripts/analyze_audio.py", "--serve"},
+		serveCommand([]string{"python3", "scripts/analyze_audio.py"}))
+	assert.Equal(t,
+		[]string{"docker", "exec", "-i", "analyzer", "python", "/app/analyze_audio.py", "--serve"},
+		serveCommand([]string{"docker", "exec", "analyzer", "python", "/app/analyze_audio.py"}))
+	assert.Equal(t,
+		[]string{"docker", "exec", "-i", "analyzer", "python", "/app/analyze_audio.py", "--serve"},
+		serveCommand([]string{"docker", "exec", "-i", "analyzer", "python", "/app/analyze_audio.py"}))
+}
+
+func TestAnalysisWorker_ReusesProcess(t *testing.T) {
+	worker := newAnalysisWorker([]string{"python3", "-c", echoWorker})
+	defer worker.stop()
+	ctx := context.Background()
+
+	result, err := worker.Analyze(ctx, workerRequest{RequestID: "a", RecordedFile: "a.wav", SignalID: "sweep", RoomData: map[string]float64{"room_length_feet": 12}})
+	require.NoError(t, err)
+	assert.JSONEq(t, `{"signal_id":"sweep","room_data":{"room_length_feet":12}}`, string(result))
+	pid := worker.cmd.Process.Pid
+
+	result, err = worker.Analyze(ctx, workerRequest{RequestID: "b", RecordedFile: "b.wav", SignalID: "sweep"})
+	require.NoError(t, err)
+	assert.JSONEq(t, `{"signal_id":"sweep","room_data":null}`, string(result))
+	assert.Equal(t, pid, worker.cmd.Process.Pid)
+}
+
+func TestAnalysisWorker_RestartsAfterExit(t *testing.T) {
+	worker := newAnalysisWorker([]string{"python3", "-c", echoWorker})
+	defer worker.stop()
+	ctx := context.Background()
+
+	_, err := worker.Analyze(ctx, workerRequest{RequestID: "a", RecordedFile: "crash.wav", SignalID: "sweep"})
+	assert.Error(t, err)
+	assert.Nil(t, worker.cmd)
+
+	result, err := worker.Analyze(ctx, workerRequest{RequestID: "b", RecordedFile: "b.wav", SignalID: "sweep"})
+	require.NoError(t, err)
+	assert.JSONEq(t, `{"signal_id":"sweep","room_data":null}`, string(result))
+}
+
+func TestAnalysisWorker_Cancelled(t *testing.T) {
+	worker := newAnalysisWorker([]string{"python3", "-c", "import time; time.sleep(60)"})
+	defer worker.stop()
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	_, err := worker.Analyze(ctx, workerRequest{RequestID: "a", RecordedFile: "a.wav", SignalID: "sweep"})
+	assert.ErrorIs(t, err, context.Canceled)
+	assert.Nil(t, worker.cmd)
+}
@@ -0,0 +1,133 @@
+"""Shared helpers for generating and inspecting audio test fixtures"""
+
+import struct
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; test helpers fall back to NumPy
+    njit = None
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _absmax(a):
+        """Peak |value| of a 1-D array in one pass, without an |a| temporary"""
+        peak = 0.0
+        for i in range(a.shape[0]):
+            v = abs(a[i])
+            if v > peak:
+                peak = v
+        return peak
+
+    @njit(fastmath=True, cache=True)
+    def _normalize_peak_inplace(a):
+        """Scale a 1-D array in place so its peak |value| is 1"""
+        inv = 1.0 / _absmax(a)
+        for i in range(a.shape[0]):
+            a[i] *= inv
+
+    @njit(fastmath=True, cache=True)
+    def _peak_near(freqs, mags, target_freq, tolerance_hz):
+        """Index of the loudest point within tolerance_hz of target_freq in sorted freqs, or -1"""
+        lo = np.searchsorted(freqs, target_freq - tolerance_hz, side='left')
+        hi = np.searchsorted(freqs, target_freq + tolerance_hz, side='right')
+        best = -1
+        best_mag = -np.inf
+        for i in range(lo, hi):
+            if mags[i] > best_mag:
+                best_mag = mags[i]
+                best = i
+        return best
+
+
+class AudioTestUtils:
+    """Utility methods for audio test generation"""
+
+    @staticmethod
+    def generate_sine_wave(frequency, sample_rate, duration, amplitude=1.0):
+        """Generate a float32 sine wave audio signal"""
+        t = np.arange(int(sample_rate * duration), dtype=np.float32)
+        audio = np.sin((2 * np.pi * frequency / sample_rate) * t, dtype=np.float32)
+        audio *= np.float32(amplitude)
+        return audio
+
+    @staticmethod
+    def peaking_eq(center_freq, gain_db, q, sample_rate):
+        """(b, a) coefficients of an RBJ peaking EQ biquad, for simulating a room resonance"""
+        A = 10 ** (gain_db / 40)
+        w0 = 2 * np.pi * center_freq / sample_rate
+        alpha = np.sin(w0) / (2 * q)
+        b = np.array([1 + alpha * A, -2 * np.cos(w0), 1 - alpha * A])
+        a = np.array([1 + alpha / A, -2 * np.cos(w0), 1 - alpha / A])
+        return b / a[0], a / a[0]
+
+    @staticmethod
+    def create_wav_file(audio, sample_rate, filename):
+        """
+        Create a mono 16-bit PCM WAV file from audio data in [-1, 1].
+
+        Writes the 44-byte header directly, then quantizes straight into a
+        memory map of the data chunk instead of building an int16 copy first.
+        """
+        data_size = 2 * len(audio)
+        header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b'data', data_size,
+        )
+        with open(filename, 'wb') as f:
+            f.write(header)
+            f.truncate(len(header) + data_size)
+
+        samples = np.memmap(filename, dtype='<i2', mode='r+', offset=len(header), shape=(len(audio),))
+        np.multiply(audio, 32767, out=samples, casting='unsafe')
+        samples.flush()
+        del samples
+
+    @staticmethod
+    def absmax(audio):
+        """Peak |value| of a 1-D audio array"""
+        if njit is not None:
+            return float(_absmax(audio))
+        return float(np.abs(audio).max())
+
+    @staticmethod
+    def normalize_inplace(audio):
+        """Scale audio in place to a peak |value| of 1 and return it"""
+        if njit is not None:
+            _normalize_peak_inplace(audio)
+        else:
+            np.divide(audio, np.abs(audio).max(), out=audio)
+        return audio
+
+    @staticmethod
+    def frequency_arrays(result):
+        """
+        Get (frequencies, magnitudes) arrays from an analysis result.
+
+        Uses the columnar "frequencies"/"magnitudes" arrays when the result has
+        them, otherwise extracts both from the frequency_data points once.
+        """
+        if 'frequencies' in result:
+            return np.asarray(result['frequencies'], dtype=float), np.asarray(result['magnitudes'], dtype=float)
+        freq_data = result['frequency_data']
+        freqs = np.fromiter((p['frequency'] for p in freq_data), float, count=len(freq_data))
+        mags = np.fromiter((p['magnitude'] for p in freq_data), float, count=len(freq_data))
+        return freqs, mags
+
+    @staticmethod
+    def find_peak_near_frequency(freqs, mags, target_freq, tolerance_hz=50):
+        """Find the loudest point within tolerance_hz of target frequency (freqs must be sorted)"""
+        if njit is not None:
+            idx = _peak_near(freqs, mags, float(target_freq), float(tolerance_hz))
+            if idx < 0:
+                return None
+            return {'frequency': float(freqs[idx]), 'magnitude': float(mags[idx])}
+
+        lo = int(np.searchsorted(freqs, target_freq - tolerance_hz, side='left'))
+        hi = int(np.searchsorted(freqs, target_freq + tolerance_hz, side='right'))
+        if hi <= lo:
+            return None
+        idx = lo + int(mags[lo:hi].argmax())
+        return {'frequency': float(freqs[idx]), 'magnitude': float(mags[idx])}
@@ -6,17 +6,238 @@ Performs FFT analysis on audio files with FIFINE K669 microphone calibration
 
 # Enable logging to stderr (visible to Go process) - MUST be first
 import sys
+import os
 import logging
-logging.basicConfig(level=logging.INFO, format='[PYTHON] %(asctime)s - %(levelname)s - %(message)s', stream=sys.stderr)
+# SONARA_LOG_LEVEL lets the caller turn the per-step INFO logs down (e.g. WARNING)
+logging.basicConfig(
+    level=getattr(logging, os.environ.get("SONARA_LOG_LEVEL", "INFO").upper(), logging.INFO),
+    format='[PYTHON] %(asctime)s - %(levelname)s - %(message)s',
+    stream=sys.stderr,
+)
+logger = logging.getLogger(__name__)
 import json
-import math
+import atexit
+import struct
+import tempfile
+import functools
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from scipy import fft as sfft
 from scipy import signal
-from scipy import interpolate
 from scipy.io import wavfile
-import librosa
 
-from reference_signals import get_reference_manager
+try:
+    from numba import njit, prange, set_num_threads
+except ImportError:  # numba is optional; smoothing falls back to pure NumPy
+    njit = None
+
+try:
+    import pyfftw
+    import pyfftw.interfaces.cache
+    import pyfftw.interfaces.scipy_fft
+except ImportError:  # pyfftw is optional; FFTs stay on scipy's pocketfft
+    pyfftw = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; results are encoded with the stdlib json module
+    orjson = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; dB conversion falls back to in-place NumPy
+    ne = None
+
+from reference_signals import get_reference_manager, load_mono
+
+
+# Per-user cache dir rather than the shared temp dir, which other users (or
+# containers bind-mounting /tmp) could write to
+FFTW_WISDOM_FILE = os.environ.get("SONARA_FFTW_WISDOM") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "sonara", "fftw_wisdom.bin",
+)
+
+
+# Wisdom imported from FFTW_WISDOM_FILE at startup, as compared by _wisdom_entries
+_loaded_fftw_wisdom = None
+
+
+def _wisdom_entries(wisdom):
+    """
+    Comparable form of export_wisdom() output: one set of lines per precision.
+
+    FFTW re-exports the same plans in hash-table order, so the raw bytes can
+    differ even when no plan was added.
+    """
+    return tuple(frozenset(entry.splitlines()) for entry in wisdom)
+
+
+def _save_fftw_wisdom():
+    """
+    Persist FFTW plans so the next process skips planning for the same sizes.
+
+    export_wisdom() returns a tuple of byte strings, stored length-prefixed (no
+    pickle, so loading a tampered file can't run code). The file is written to a
+    temp file and renamed, since every analyze_batch worker saves it at exit.
+    Nothing is written when this process planned no new transforms.
+    """
+    wisdom = pyfftw.export_wisdom()
+    if _wisdom_entries(wisdom) == _loaded_fftw_wisdom:
+        return
+    cache_dir = os.path.dirname(os.path.abspath(FFTW_WISDOM_FILE))
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".fftw_wisdom.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for entry in wisdom:
+                    f.write(struct.pack("<I", len(entry)))
+                    f.write(entry)
+            os.replace(tmp_path, FFTW_WISDOM_FILE)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning("Could not save FFTW wisdom: %s", e)
+
+
+def _load_fftw_wisdom():
+    """Import FFTW plans saved by _save_fftw_wisdom, ignoring a missing or malformed file."""
+    global _loaded_fftw_wisdom
+    try:
+        with open(FFTW_WISDOM_FILE, "rb") as f:
+            data = f.read()
+    except OSError:
+        return  # No wisdom yet; plans are built on first use
+
+    entries = []
+    offset = 0
+    while offset + 4 <= len(data):
+        (size,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        entries.append(data[offset:offset + size])
+        offset += size
+    if offset != len(data) or len(entries) != 3:
+        logger.warning("Ignoring malformed FFTW wisdom file: %s", FFTW_WISDOM_FILE)
+        return
+    pyfftw.import_wisdom(tuple(entries))
+    _loaded_fftw_wisdom = _wisdom_entries(entries)
+
+
+if pyfftw is not None:
+    # fft_size is fixed, so the same transform sizes repeat across runs; route
+    # scipy.fft through FFTW and reuse its plans both in-process and on disk
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)  # Keep plans alive between --serve requests
+    _load_fftw_wisdom()
+    sfft.set_global_backend(pyfftw.interfaces.scipy_fft)
+    atexit.register(_save_fftw_wisdom)
+
+
+@functools.lru_cache(maxsize=8)
+def _bh_window(n):
+    """Periodic Blackman-Harris window of length n, shared read-only across analyses."""
+    window = signal.windows.blackmanharris(n, sym=False).astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
+@functools.lru_cache(maxsize=8)
+def _rfftfreq(n, sample_rate):
+    """rfft bin frequencies for an n-point transform, shared read-only across analyses."""
+    frequencies = sfft.rfftfreq(n, 1/sample_rate)
+    frequencies.flags.writeable = False
+    return frequencies
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _smooth_fractional_octave(frequencies, magnitude_db, smoothing_fraction):
+        """
+        Power-domain fractional-octave smoothing, parallel across blocks of bins.
+
+        Frequencies are sorted, so band edges only move forward: each block walks
+        lo/hi pointers and keeps a running band sum (add at hi, subtract at lo),
+        which is O(N) overall. Restarting the sum per block bounds rounding drift.
+        """
+        n = frequencies.shape[0]
+        factor = 2.0 ** (smoothing_fraction / 2.0)
+        power_values = 10.0 ** (magnitude_db / 10.0)  # dB to power
+
+        smoothed = np.empty(n, dtype=magnitude_db.dtype)
+        block_size = 256
+        n_blocks = (n + block_size - 1) // block_size
+        for block in prange(n_blocks):
+            start = block * block_size
+            stop = min(start + block_size, n)
+            lo = np.searchsorted(frequencies, frequencies[start] / factor)
+            hi = lo
+            total = 0.0
+            for i in range(start, stop):
+                upper = frequencies[i] * factor
+                while hi < n and frequencies[hi] <= upper:
+                    total += power_values[hi]
+                    hi += 1
+                lower = frequencies[i] / factor
+                while frequencies[lo] < lower:
+                    total -= power_values[lo]
+                    lo += 1
+
+                if frequencies[i] < 20:
+                    smoothed[i] = magnitude_db[i]
+                else:
+                    smoothed[i] = 10.0 * np.log10(max(total / (hi - lo), 1e-12))  # Power to dB
+        return smoothed
+
+    # Compile (or load from the on-disk cache) at import, not on the first analysis
+    _smooth_fractional_octave(np.array([20.0, 40.0]), np.zeros(2, dtype=np.float32), 1 / 3)
+
+
+@functools.lru_cache(maxsize=128)
+def _room_modes(dims_m, max_modes, min_spacing_octaves):
+    """Spaced first-order room modes for (length, width, height) in metres, cached per room."""
+    c = 343.0
+    dims = np.array(dims_m, dtype=float)
+    dims = dims[dims > 0]
+
+    # First-order axial fundamentals
+    axial = c / (2 * dims)
+
+    # First-order tangential (every pair of present dimensions)
+    pairs = np.array(list(itertools.combinations(range(dims.size), 2)), dtype=int).reshape(-1, 2)
+    tangential = c / (2 * np.sqrt(np.sum(dims[pairs] ** 2, axis=1)))
+
+    # First-order oblique (only when all three dimensions are present)
+    oblique = c / (2 * np.sqrt(np.sum(dims ** 2, keepdims=True))) if dims.size == 3 else np.empty(0)
+
+    # Keep only 20–300 Hz as before
+    modes = np.concatenate([axial, tangential, oblique])
+    modes = np.sort(modes[(modes >= 20) & (modes <= 300)])
+
+    if modes.size == 0:
+        return ()
+
+    # Thin by minimum fractional‑octave spacing: greedily jump to the first
+    # mode at least ratio_threshold above the last kept one
+    ratio_threshold = 2 ** min_spacing_octaves
+    kept = [float(modes[0])]
+    while len(kept) < max_modes:
+        idx = int(np.searchsorted(modes, kept[-1] * ratio_threshold, side='left'))
+        if idx >= modes.size:
+            break
+        kept.append(float(modes[idx]))
+
+    return tuple(kept)
+
+
+def _cache_put(cache, key, value, maxsize):
+    """Insert into a dict used as a bounded cache, evicting the oldest entry when full."""
+    if len(cache) >= maxsize:
+        del cache[next(iter(cache))]
+    cache[key] = value
 
 
 class FrequencyAnalyzer:
@@ -27,10 +248,62 @@ class FrequencyAnalyzer:
     """
 
     def __init__(self):
-        self.fft_size = 32768  # 32k FFT for high resolution
+        self.fft_size = sfft.next_fast_len(32768, real=True)  # Minimum 32k FFT for high resolution
+        self.fft_workers = min(os.cpu_count() or 1, 8)  # pocketfft threads for steps 3-7
         self.smoothing_fraction = 1/3  # 1/6 octave smoothing
         self.reference_freq = 1000  # 1kHz normalization
         self.ref_manager = get_reference_manager()
+        self._peak_scratch = None  # Reused |impulse|² buffer for the peak search
+        self._window_scratch = None  # Reused windowed-impulse buffer for the response FFT
+        # Per-instance cache (oldest entry evicted first), so kernels are freed with the analyzer
+        self._wiener_kernels = {}  # (signal_id, n, lambda_reg) -> deconvolution kernel
+
+    def _get_wiener_kernel(self, signal_id, n, lambda_reg):
+        """
+        Regularized inverse filter K = conj(X) / (|X|² + λ) for a reference sweep.
+
+        With K cached, deconvolution reduces to one FFT, one complex multiply
+        and one inverse FFT per analysis.
+        """
+        key = (signal_id, n, lambda_reg)
+        kernel = self._wiener_kernels.get(key)
+        if kernel is None:
+            # Only the kernel is kept; the sweep spectrum is dropped once it is built
+            sweep = np.asarray(self.ref_manager.get_signal_data(signal_id)["sweep_signal"], dtype=np.float32)
+            X = sfft.rfft(sweep, n)  # complex64 for float32 input
+            kernel = np.conj(X) / (X.real**2 + X.imag**2 + lambda_reg)
+            kernel = kernel.astype(np.complex64, copy=False)
+            _cache_put(self._wiener_kernels, key, kernel, maxsize=4)
+        return kernel
+
+    def load_audio(self, filepath):
+        """
+        Load a recording as mono float32 at its native sample rate (no resampling).
+
+        WAV files are memory-mapped with scipy and scaled to [-1, 1] in one
+        conversion; anything wavfile can't parse goes through soundfile, with
+        librosa as the last resort.
+        """
+        if filepath.lower().endswith('.wav'):
+            try:
+                sr, data = wavfile.read(filepath, mmap=True)
+            except ValueError as e:
+                logger.info("wavfile could not parse %s (%s), falling back to soundfile", filepath, e)
+            else:
+                if data.dtype == np.uint8:
+                    audio = data.astype(np.float32)
+                    audio -= 128.0
+                    audio *= 1 / 128.0
+                elif data.dtype.kind == 'i':
+                    audio = data.astype(np.float32)  # Copies out of the memory map
+                    audio *= 1 / float(2 ** (8 * data.dtype.itemsize - 1))
+                else:
+                    audio = np.array(data, dtype=np.float32)
+                if audio.ndim == 2:
+                    audio = audio.mean(axis=1, dtype=np.float32)  # Downmix to mono
+                return audio, sr
+
+        return load_mono(filepath)
 
     def align_signals(self, recorded, reference):
         """
@@ -46,25 +319,46 @@ class FrequencyAnalyzer:
         Returns:
             numpy array: Aligned recorded signal
         """
-        logging.info("Aligning signals using cross-correlation")
+        logger.info("Aligning signals using cross-correlation")
 
-        # Compute cross-correlation
-        correlation = signal.correlate(recorded, reference, mode='valid')
+        recorded = np.asarray(recorded, dtype=np.float32)
+        reference = np.asarray(reference, dtype=np.float32)
 
-        # Find the delay that gives maximum correlation
-        delay = np.argmax(np.abs(correlation))
-        logging.info(f"Optimal delay found: {delay} samples")
+        if len(recorded) >= len(reference):
+            # Every valid lag is searched: the browser may start the sweep
+            # seconds after recording begins, so there is no safe latency bound
+            delay = self._find_correlation_peak(recorded, reference)
+        else:
+            # Recording shorter than the sweep: nothing to search over
+            delay = 0
+        logger.info("Optimal delay found: %s samples", delay)
 
         # Align by trimming the recorded signal
         if delay < len(recorded):
             aligned = recorded[delay:delay + len(reference)]
-            logging.info(f"Aligned signal length: {len(aligned)} samples")
+            logger.info("Aligned signal length: %d samples", len(aligned))
             return aligned
         else:
             # If delay is too large, return original (fallback)
-            logging.warning("Alignment delay too large, using original signal")
+            logger.warning("Alignment delay too large, using original signal")
             return recorded[:len(reference)] if len(recorded) > len(reference) else recorded
 
+    def _find_correlation_peak(self, recorded, reference):
+        """
+        Lag of the cross-correlation peak over all 'valid' lags, computed via FFT.
+        """
+        # Padding to at least len(recorded) keeps the valid lags free of circular
+        # wrap-around. n follows the recording length, so the reference spectrum
+        # is recomputed rather than cached: entries would rarely be reused
+        n = sfft.next_fast_len(len(recorded), real=True)
+        R = sfft.rfft(recorded, n)
+        R *= np.conj(sfft.rfft(reference, n))
+        correlation = sfft.irfft(R, n, overwrite_x=True)
+        correlation = correlation[:len(recorded) - len(reference) + 1]
+
+        # Squaring in place ranks lags by magnitude like abs() but without a temporary array
+        return int(np.argmax(np.square(correlation, out=correlation)))
+
     def analyze_sweep_deconvolution(self, recorded_file, signal_id, room_data=None):
         """
         Main sweep deconvolution pipeline for frequency response measurement.
@@ -75,72 +369,98 @@ class FrequencyAnalyzer:
             room_data: Optional dict with room dimensions in feet (room_length_feet, room_width_feet, room_height_feet)
 
         Returns:
-            tuple: (frequencies, response_db, room_modes) - frequencies and response arrays, plus calculated room mode frequencies
+            tuple: (frequencies, response_db, room_modes, fft_size) - frequencies and response arrays,
+                calculated room mode frequencies, and the length of the response FFT
         """
-        logging.info(f"Starting sweep deconvolution analysis for file: {recorded_file}, signal: {signal_id}")
+        logger.info("Starting sweep deconvolution analysis for file: %s, signal: %s", recorded_file, signal_id)
 
         # 1. Load cached reference data
-        logging.info("Step 1: Loading reference signal data")
-        ref_data = self.ref_manager.get_signal_data(signal_id)
-        if not ref_data:
-            raise ValueError(f"Unknown or invalid signal ID: {signal_id}")
-        logging.info(f"Reference signal loaded successfully - sample rate: {ref_data.get('sample_rate', 'unknown')}Hz")
+        ref_data = self._load_reference(signal_id)
 
         # 2. Load recorded audio
-        logging.info("Step 2: Loading recorded audio file")
+        logger.info("Step 2: Loading recorded audio file")
         try:
-            recorded, sr = librosa.load(recorded_file, sr=None, mono=True)
+            recorded, sr = self.load_audio(recorded_file)
             duration = len(recorded) / sr
-            logging.info(f"Recorded audio loaded - sample rate: {sr}Hz, duration: {duration:.2f}s, samples: {len(recorded)}")
+            logger.info("Recorded audio loaded - sample rate: %sHz, duration: %.2fs, samples: %d", sr, duration, len(recorded))
         except Exception as e:
             raise ValueError(f"Failed to load recorded file {recorded_file}: {e}")
 
-        # 3. Align signals using cross-correlation
-        logging.info("Step 3: Aligning recorded signal with reference")
-        aligned_recorded = self.align_signals(recorded, ref_data["sweep_signal"])
-        logging.info(f"Signal alignment completed - aligned length: {len(aligned_recorded)} samples")
+        return self._run_sweep_pipeline(recorded, sr, ref_data, signal_id, room_data)
 
-        # 4. Perform regularized spectral division deconvolution
-        logging.info("Step 4: Performing regularized spectral division deconvolution")
-        impulse_response = self.deconvolve_signals(
-            aligned_recorded, ref_data["sweep_signal"]
-        )
-        logging.info(f"Deconvolution completed - impulse response length: {len(impulse_response)} samples")
-
-        # 5. Extract acoustic impulse window
-        logging.info("Step 5: Extracting acoustic impulse window")
-        impulse_windowed = self.extract_impulse_window(impulse_response, sr)
-        logging.info(f"Impulse window extracted - length: {len(impulse_windowed)} samples")
-
-        # 6. Convert impulse response to frequency response
-        logging.info("Step 6: Converting impulse to frequency response")
-        freqs, response_db = self.impulse_to_frequency_response(impulse_windowed, sr)
-        logging.info(f"Frequency response calculated - {len(freqs)} frequency points")
+    def analyze_sweep_array(self, recorded, sample_rate, signal_id, room_data=None):
+        """
+        Run the sweep deconvolution pipeline on in-memory mono samples.
 
-        # 7. Apply fractional octave smoothing
-        logging.info("Step 7: Applying fractional octave smoothing")
-        smooth_response = self.apply_fractional_octave_smoothing(freqs, response_db)
-        logging.info("Fractional octave smoothing applied")
+        Same as analyze_sweep_deconvolution, minus loading the recording from disk.
+        """
+        logger.info("Starting sweep deconvolution analysis for %d in-memory samples, signal: %s", len(recorded), signal_id)
+        ref_data = self._load_reference(signal_id)
+        recorded = np.asarray(recorded, dtype=np.float32)
+        # Window lengths are derived from the rate by integer division, so 44100.0 must become 44100
+        return self._run_sweep_pipeline(recorded, int(sample_rate), ref_data, signal_id, room_data)
+
+    def _load_reference(self, signal_id):
+        """Step 1: fetch the cached reference signal data for signal_id"""
+        logger.info("Step 1: Loading reference signal data")
+        ref_data = self.ref_manager.get_signal_data(signal_id)
+        if not ref_data:
+            raise ValueError(f"Unknown or invalid signal ID: {signal_id}")
+        logger.info("Reference signal loaded successfully - sample rate: %sHz", ref_data.get('sample_rate', 'unknown'))
+        return ref_data
+
+    def _run_sweep_pipeline(self, recorded, sr, ref_data, signal_id, room_data):
+        """Steps 3-9 of the sweep deconvolution pipeline on loaded float32 samples"""
+        # Steps 3-7 share one pocketfft worker setting rather than passing
+        # workers to every FFT call
+        with sfft.set_workers(self.fft_workers):
+            # 3. Align signals using cross-correlation
+            logger.info("Step 3: Aligning recorded signal with reference")
+            aligned_recorded = self.align_signals(recorded, ref_data["sweep_signal"])
+            logger.info("Signal alignment completed - aligned length: %d samples", len(aligned_recorded))
+
+            # 4. Perform regularized spectral division deconvolution
+            logger.info("Step 4: Performing regularized spectral division deconvolution")
+            impulse_response = self.deconvolve_signals(
+                aligned_recorded, ref_data["sweep_signal"], signal_id=signal_id
+            )
+            logger.info("Deconvolution completed - impulse response length: %d samples", len(impulse_response))
+
+            # 5. Extract acoustic impulse window
+            logger.info("Step 5: Extracting acoustic impulse window")
+            # After alignment the direct sound sits at the start of the impulse
+            impulse_windowed = self.extract_impulse_window(impulse_response, sr, expected_peak=0)
+            logger.info("Impulse window extracted - length: %d samples", len(impulse_windowed))
+
+            # 6. Convert impulse response to frequency response
+            logger.info("Step 6: Converting impulse to frequency response")
+            freqs, response_db, fft_size = self.impulse_to_frequency_response(impulse_windowed, sr)
+            logger.info("Frequency response calculated - %d frequency points", len(freqs))
+
+            # 7. Apply fractional octave smoothing
+            logger.info("Step 7: Applying fractional octave smoothing")
+            smooth_response = self.apply_fractional_octave_smoothing(freqs, response_db)
+            logger.info("Fractional octave smoothing applied")
 
         # 8. Normalize to 0dB at 1kHz
-        logging.info("Step 8: Normalizing response to 0dB at 1kHz")
+        logger.info("Step 8: Normalizing response to 0dB at 1kHz")
         final_response = self.normalize_response(freqs, smooth_response)
-        logging.info("Response normalization completed")
+        logger.info("Response normalization completed")
 
         # 9. Calculate room modes if room data is available
         room_modes = []
         if room_data:
-            logging.info("Step 9: Calculating room modes from provided dimensions")
+            logger.info("Step 9: Calculating room modes from provided dimensions")
             room_modes = self.calculate_room_modes(room_data)
-            logging.info(f"Room modes calculated: {len(room_modes)} modes found")
+            logger.info("Room modes calculated: %d modes found", len(room_modes))
         else:
-            logging.info("Step 9: No room data provided, skipping room mode calculation")
+            logger.info("Step 9: No room data provided, skipping room mode calculation")
 
-        logging.info(f"Sweep deconvolution analysis completed - final result: {len(freqs)} frequency points, {len(room_modes)} room modes")
-        return freqs, final_response, room_modes
+        logger.info("Sweep deconvolution analysis completed - final result: %d frequency points, %d room modes", len(freqs), len(room_modes))
+        return freqs, final_response, room_modes, fft_size
 
 
-    def deconvolve_signals(self, recorded, reference_sweep, lambda_reg=1e-3):
+    def deconvolve_signals(self, recorded, reference_sweep, lambda_reg=1e-3, signal_id=None):
         """
         Deconvolve recorded signal with reference sweep using regularized spectral division.
 
@@ -151,38 +471,68 @@ class FrequencyAnalyzer:
             recorded: Recorded audio signal (numpy array)
             reference_sweep: Reference sweep signal (numpy array)
             lambda_reg: Regularization parameter (default: 1e-3)
+            signal_id: Optional reference signal ID; when given, the Wiener kernel
+                is taken from the per-(signal_id, n, lambda_reg) cache
 
         Returns:
             numpy array: Impulse response
         """
-        logging.info("Performing regularized spectral division deconvolution")
-
-        # Pad to avoid circular convolution artifacts
-        n = len(recorded) + len(reference_sweep) - 1
-
-        # FFT of both signals
-        Y = np.fft.fft(recorded, n)  # Recorded signal
-        X = np.fft.fft(reference_sweep, n)  # Reference sweep
+        logger.info("Performing regularized spectral division deconvolution")
+
+        # Single precision is ample for audio; scipy.fft keeps float32 input in
+        # complex64, halving FFT memory traffic versus the float64 default
+        recorded = np.asarray(recorded, dtype=np.float32)
+        reference_sweep = np.asarray(reference_sweep, dtype=np.float32)
+
+        # Pad to avoid circular convolution artifacts, rounded up to a 5-smooth
+        # size so pocketfft avoids its slow Bluestein path on prime-like lengths.
+        # The extra trailing zero-pad is sliced off after the inverse FFT.
+        n_linear = len(recorded) + len(reference_sweep) - 1
+        n = sfft.next_fast_len(n_linear, real=True)
+
+        # Real FFTs of both signals (multithreaded pocketfft); both inputs are
+        # real audio, so the half spectrum carries all the information
+        Y = sfft.rfft(recorded, n)  # Recorded signal
+        if signal_id is not None:
+            # Cached Wiener kernel for this sweep, padded length and λ
+            kernel = self._get_wiener_kernel(signal_id, n, lambda_reg)
+        else:
+            X = sfft.rfft(reference_sweep, n)  # Reference sweep
+            kernel = np.conj(X) / (X.real**2 + X.imag**2 + lambda_reg)
 
-        # Regularized spectral division: H = (Y * conj(X)) / (|X|² + λ)
+        # Regularized spectral division: H = Y * K with K = conj(X) / (|X|² + λ)
         # This gives us the transfer function H such that recorded = reference_sweep * H
-        H = (Y * np.conj(X)) / (np.abs(X)**2 + lambda_reg)
+        # Y is freshly owned, so build H in place on top of it
+        H = Y
+        H *= kernel
 
-        # Inverse FFT to get impulse response
-        impulse = np.real(np.fft.ifft(H))
+        # Inverse FFT to get impulse response (H is a temporary, so it can be overwritten)
+        impulse = sfft.irfft(H, n, overwrite_x=True)[:n_linear].astype(np.float32, copy=False)
 
-        logging.info(f"Deconvolution completed - impulse response length: {len(impulse)} samples")
+        logger.info("Deconvolution completed - impulse response length: %d samples", len(impulse))
         return impulse
 
-    def extract_impulse_window(self, impulse, sample_rate):
+    def extract_impulse_window(self, impulse, sample_rate, expected_peak=None):
         """
         Extract the main impulse response with acoustic-appropriate windowing.
 
         Finds the main peak and windows around it for room acoustic measurements.
         Uses 450ms total window (50ms before peak, 400ms after peak).
+
+        If expected_peak is given, the peak is only searched for within ±0.5s of it.
         """
-        # Find main impulse peak
-        peak_idx = np.argmax(np.abs(impulse))
+        # Find main impulse peak, narrowing the search when its position is known
+        lo, hi = 0, len(impulse)
+        if expected_peak is not None:
+            lo = max(0, expected_peak - sample_rate // 2)
+            hi = min(len(impulse), expected_peak + sample_rate // 2)
+        # argmax of the square matches argmax of abs, written into a reused
+        # buffer instead of allocating a fresh abs array on every call
+        search = impulse[lo:hi]
+        if self._peak_scratch is None or self._peak_scratch.size != search.size or self._peak_scratch.dtype != search.dtype:
+            self._peak_scratch = np.empty_like(search)
+        np.square(search, out=self._peak_scratch)
+        peak_idx = lo + int(np.argmax(self._peak_scratch))
 
         # Acoustic window: 450ms total (50ms before, 400ms after peak)
         pre_samples = int(0.05 * sample_rate)  # 50ms before peak (reduced from 100ms)
@@ -191,28 +541,49 @@ class FrequencyAnalyzer:
         start = max(0, peak_idx - pre_samples)
         end = min(len(impulse), peak_idx + post_samples)
 
-        logging.info(f"Impulse window: peak at {peak_idx}, window from {start} to {end} ({(end-start)/sample_rate*1000:.1f}ms)")
+        logger.info("Impulse window: peak at %s, window from %s to %s (%.1fms)", peak_idx, start, end, (end-start)/sample_rate*1000)
         return impulse[start:end]
 
     def impulse_to_frequency_response(self, impulse, sample_rate):
         """
         Convert impulse response to frequency response via FFT.
-        """
-        # Apply window to reduce spectral leakage
-        window = signal.get_window('blackmanharris', len(impulse))
-        windowed = impulse * window
-
-        # High-resolution FFT
-        fft_result = np.fft.rfft(windowed, n=self.fft_size)
-        frequencies = np.fft.rfftfreq(self.fft_size, 1/sample_rate)
 
-        # Convert to dB magnitude
-        magnitude_db = 20 * np.log10(np.abs(fft_result) + 1e-12)
+        Returns (frequencies, magnitude_db, n), where n is the FFT length used.
+        """
+        # Apply window to reduce spectral leakage, into a buffer reused across calls
+        if self._window_scratch is None or self._window_scratch.size != impulse.size or self._window_scratch.dtype != impulse.dtype:
+            self._window_scratch = np.empty_like(impulse)
+        windowed = np.multiply(impulse, _bh_window(len(impulse)), out=self._window_scratch)
+
+        # High-resolution FFT: fft_size is the minimum length (zero-padded for
+        # resolution); longer impulses get the next 5-smooth size that fits them
+        # whole instead of being truncated
+        n = sfft.next_fast_len(max(len(windowed), self.fft_size), real=True)
+        fft_result = sfft.rfft(windowed, n=n)
+        frequencies = _rfftfreq(n, sample_rate)
+
+        # Convert to dB magnitude via |z|² in one buffer: 10·log10(|z|²) = 20·log10(|z|),
+        # which skips the sqrt in np.abs and the intermediate temporaries
+        if ne is not None:
+            # numexpr fuses square, floor and log10 into one multithreaded pass
+            re, im = fft_result.real, fft_result.imag
+            magnitude_db = np.empty(fft_result.shape, dtype=re.dtype)
+            ne.evaluate("10 * log10(where(re*re + im*im > 1e-24, re*re + im*im, 1e-24))",
+                        out=magnitude_db, casting='same_kind')
+        else:
+            magnitude_db = np.empty(fft_result.shape, dtype=fft_result.real.dtype)
+            np.multiply(fft_result.real, fft_result.real, out=magnitude_db)
+            magnitude_db += fft_result.imag * fft_result.imag
+            np.maximum(magnitude_db, 1e-24, out=magnitude_db)  # Floor instead of an add pass to avoid log(0)
+            np.log10(magnitude_db, out=magnitude_db)
+            magnitude_db *= 10.0
 
-        # Filter to audible range (20Hz - 20kHz)
-        audible_mask = (frequencies >= 20) & (frequencies <= 20000)
+        # Filter to audible range (20Hz - 20kHz); the bins are sorted, so the
+        # range is contiguous and slicing returns views instead of copies
+        lo = np.searchsorted(frequencies, 20, side='left')
+        hi = np.searchsorted(frequencies, 20000, side='right')
 
-        return frequencies[audible_mask], magnitude_db[audible_mask]
+        return frequencies[lo:hi], magnitude_db[lo:hi], n
 
     def apply_fractional_octave_smoothing(self, frequencies, magnitude_db):
         """
@@ -221,42 +592,52 @@ class FrequencyAnalyzer:
         Correctly averages in power domain (not dB domain) for mathematically sound results.
         Smoothing reduces noise while preserving acoustic detail.
         """
-        smoothed = np.zeros_like(magnitude_db)
-
-        for i, center_freq in enumerate(frequencies):
-            if center_freq < 20:
-                smoothed[i] = magnitude_db[i]
-                continue
-
-            # Calculate smoothing bandwidth (1/12 octave)
-            factor = 2 ** (self.smoothing_fraction / 2)
-            lower_freq = center_freq / factor
-            upper_freq = center_freq * factor
-
-            # Find all frequencies in this band
-            in_band = (frequencies >= lower_freq) & (frequencies <= upper_freq)
-
-            if np.any(in_band):
-                # Convert dB to power, average power, then back to dB
-                # This is mathematically correct (average intensity, not amplitudes)
-                power_values = 10 ** (magnitude_db[in_band] / 10)  # dB to power
-                avg_power = np.mean(power_values)  # Average power
-                smoothed[i] = 10 * np.log10(avg_power + 1e-12)  # Power to dB
-            else:
-                smoothed[i] = magnitude_db[i]
-
-        return smoothed
+        if njit is not None:
+            return _smooth_fractional_octave(
+                np.ascontiguousarray(frequencies, dtype=np.float64),
+                np.ascontiguousarray(magnitude_db),
+                float(self.smoothing_fraction),
+            )
+
+        # Calculate smoothing bandwidth (1/12 octave)
+        factor = 2 ** (self.smoothing_fraction / 2)
+
+        # Frequencies are sorted, so each band [f/factor, f*factor] is a
+        # contiguous index range; find all band edges in one vectorized pass
+        lo = np.searchsorted(frequencies, frequencies / factor, side='left')
+        hi = np.searchsorted(frequencies, frequencies * factor, side='right')
+
+        # Convert dB to power, average power per band via a prefix sum, then back to dB
+        # This is mathematically correct (average intensity, not amplitudes)
+        if ne is not None:
+            power_values = ne.evaluate("10 ** (magnitude_db / 10)")  # dB to power, one fused pass
+        else:
+            power_values = np.power(10.0, magnitude_db / 10)  # dB to power
+        cumulative = np.empty(len(power_values) + 1)
+        cumulative[0] = 0.0
+        np.cumsum(power_values, dtype=np.float64, out=cumulative[1:])
+        smoothed = cumulative[hi] - cumulative[lo]
+        smoothed /= np.maximum(hi - lo, 1)  # Average power per band
+        np.maximum(smoothed, 1e-12, out=smoothed)  # Floor to avoid log(0)
+        np.log10(smoothed, out=smoothed)
+        smoothed *= 10  # Power to dB
+
+        # Every band contains its own center bin; sub-20Hz bins pass through unchanged
+        return np.where(frequencies < 20, magnitude_db, smoothed).astype(magnitude_db.dtype, copy=False)
 
     def normalize_response(self, frequencies, response_db):
         """
         Normalize frequency response to 0dB at 1kHz (industry standard).
+
+        response_db is modified in place and returned.
         """
         # Find closest frequency to 1kHz
         ref_idx = np.argmin(np.abs(frequencies - self.reference_freq))
         ref_level = response_db[ref_idx]
 
-        # Subtract reference level from all points
-        return response_db - ref_level
+        # Subtract reference level from all points, reusing the smoothed buffer
+        response_db -= ref_level
+        return response_db
 
     def resample_log_spaced(self, frequencies, magnitudes, num_points=300):
         """
@@ -265,17 +646,8 @@ class FrequencyAnalyzer:
         # Create log-spaced frequency points from 20Hz to 20kHz
         log_freqs = np.logspace(np.log10(20), np.log10(20000), num_points)
 
-        # Create interpolation function
-        interp_func = interpolate.interp1d(
-            frequencies,
-            magnitudes,
-            kind='linear',  # Linear is more accurate for audio
-            bounds_error=False,
-            fill_value=np.nan
-        )
-
-        # Interpolate at log-spaced frequencies
-        log_magnitudes = interp_func(log_freqs)
+        # Linear interpolation (more accurate for audio); out-of-range points become NaN
+        log_magnitudes = np.interp(log_freqs, frequencies, magnitudes, left=np.nan, right=np.nan)
 
         # Remove any NaN values (shouldn't happen with 20-20k range)
         valid_mask = ~np.isnan(log_magnitudes)
@@ -300,62 +672,169 @@ class FrequencyAnalyzer:
             height_m = height * 0.3048 if height > 0 else 0
 
             if not any([length_m, width_m, height_m]):
-                logging.info("No room dimensions provided, skipping room mode calculation")
+                logger.info("No room dimensions provided, skipping room mode calculation")
                 return []
 
-            c = 343.0
-            modes = []
-
-            # First-order axial fundamentals
-            if length_m > 0:
-                modes.append(c / (2 * length_m))
-            if width_m > 0:
-                modes.append(c / (2 * width_m))
-            if height_m > 0:
-                modes.append(c / (2 * height_m))
-
-            # First-order tangential
-            if length_m > 0 and width_m > 0:
-                modes.append(c / (2 * math.sqrt(length_m**2 + width_m**2)))
-            if length_m > 0 and height_m > 0:
-                modes.append(c / (2 * math.sqrt(length_m**2 + height_m**2)))
-            if width_m > 0 and height_m > 0:
-                modes.append(c / (2 * math.sqrt(width_m**2 + height_m**2)))
-
-            # First-order oblique
-            if all([length_m > 0, width_m > 0, height_m > 0]):
-                modes.append(c / (2 * math.sqrt(length_m**2 + width_m**2 + height_m**2)))
-
-            # Keep only 20–300 Hz as before
-            modes = sorted(m for m in modes if 20 <= m <= 300)
-
-            if not modes:
-                return []
-
-            # Thin by minimum fractional‑octave spacing
-            ratio_threshold = 2 ** min_spacing_octaves
-            kept = []
-            for m in modes:
-                if not kept or (m / kept[-1]) >= ratio_threshold:
-                    kept.append(m)
-                if len(kept) >= max_modes:
-                    break
-
-            logging.info(f"Selected {len(kept)} spaced modes (≤{max_modes}) in 20–300 Hz")
+            kept = list(_room_modes((length_m, width_m, height_m), max_modes, min_spacing_octaves))
+            logger.info("Selected %d spaced modes (≤%s) in 20–300 Hz", len(kept), max_modes)
             return kept
 
         except Exception as e:
-            logging.error(f"Error calculating room modes: {e}")
+            logger.error("Error calculating room modes: %s", e)
             return []
 
 
+def run_analysis(analyzer, recorded_file, signal_id, room_data=None):
+    """
+    Run sweep deconvolution on one recording and build the result payload.
+
+    Failures are reported as {"error": ...} in the returned dict rather than raised.
+    """
+    try:
+        logger.info("Starting sweep deconvolution analysis")
+        frequencies, response_db, room_modes, fft_size = analyzer.analyze_sweep_deconvolution(
+            recorded_file, signal_id, room_data
+        )
+        logger.info("Sweep deconvolution completed - generated %d frequency points, %d room modes", len(frequencies), len(room_modes))
+
+        # Format for frontend with log-spaced resampling
+        logger.info("Resampling from %d to 300 log-spaced points", len(frequencies))
+        display_freqs, display_mags = analyzer.resample_log_spaced(
+            frequencies, response_db, num_points=300
+        )
+        logger.info("Resampled to %d log-spaced frequency points", len(display_freqs))
+
+        # Columnar output: two parallel arrays instead of one dict per point.
+        # The arrays stay as ndarrays; dumps_result encodes them directly
+        result = {
+            "frequencies": display_freqs,
+            "magnitudes": display_mags,
+            "analysis_type": "sweep_deconvolution",
+            "smoothing": "1/12 octave",
+            "fft_size": fft_size,
+            "reference": signal_id,
+            "rt60": 0.5,  # Placeholder - can be calculated from impulse response
+            "room_modes": room_modes  # Calculated room mode frequencies
+        }
+        logger.info("Sweep deconvolution result prepared successfully")
+
+    except Exception as e:
+        error_msg = f"Sweep deconvolution failed: {str(e)}"
+        logger.error(error_msg)
+        result = {"error": error_msg}
+
+    return result
+
+
+# One analyzer per analyze_batch worker process, built by _init_batch_worker
+_batch_analyzer = None
+
+
+def _init_batch_worker():
+    """Build the worker's analyzer (and its reference signals) once, up front"""
+    global _batch_analyzer
+    # The pool already runs one process per core, so each worker stays
+    # single-threaded instead of multiplying FFT/numba/numexpr threads per core
+    if njit is not None:
+        set_num_threads(1)
+    if ne is not None:
+        ne.set_num_threads(1)
+    _batch_analyzer = FrequencyAnalyzer()
+    _batch_analyzer.fft_workers = 1
+
+
+def _analyze_batch_item(args):
+    return run_analysis(_batch_analyzer, *args)
+
+
+def analyze_batch(recorded_files, signal_id, room_data=None, workers=None):
+    """
+    Analyze several recordings against the same reference signal in parallel.
+
+    Each worker process loads the reference signals once and reuses its analyzer
+    for every file it handles. Returns one run_analysis result per file, in order.
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = [(recorded_file, signal_id, room_data) for recorded_file in recorded_files]
+    # spawn, not fork: forking after numba/pocketfft have started threads can deadlock
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_batch_worker) as executor:
+        return list(executor.map(_analyze_batch_item, tasks))
+
+
+def _json_default(obj):
+    """Fallback encoder for the stdlib json module: ndarrays become lists"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_result(obj):
+    """Encode a result payload (which may hold ndarrays) as UTF-8 JSON bytes"""
+    if orjson is not None:
+        # Serializes ndarrays natively without boxing every element as a Python float
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_json_default).encode()
+
+
+def write_result_file(output_file, result):
+    """Write a result payload to output_file as JSON"""
+    logger.info("Writing results to file: %s", output_file)
+    with open(output_file, 'wb') as f:
+        f.write(dumps_result(result))
+    logger.info("Results written to file successfully")
+
+
+def serve(analyzer):
+    """
+    Long-lived worker mode: read one JSON request per stdin line, answer with one
+    JSON line {"request_id", "result"} on stdout.
+
+    Request fields: request_id, recorded_file, signal_id, and optionally room_data
+    (dict) and output_file. Imports, the analyzer and its cached reference spectra
+    and Wiener kernels persist across requests.
+    """
+    logger.info("Serving analysis requests from stdin")
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("request_id")
+            result = run_analysis(
+                analyzer, request["recorded_file"], request["signal_id"], request.get("room_data")
+            )
+            output_file = request.get("output_file")
+            if output_file:
+                write_result_file(output_file, result)
+        except (ValueError, KeyError, AttributeError) as e:
+            logger.error("Invalid analysis request: %s", e)
+            result = {"error": f"Invalid request: {str(e)}"}
+        except OSError as e:
+            logger.error("Failed to write results to file: %s", e)
+            result = {"error": f"Failed to write output file: {str(e)}"}
+
+        sys.stdout.buffer.write(dumps_result({"request_id": request_id, "result": result}) + b"\n")
+        sys.stdout.buffer.flush()
+
+    logger.info("Request stream closed, worker exiting")
+
+
 def main():
-    logging.info("Sonara Python audio analyzer starting")
-    logging.info(f"Command line arguments: {sys.argv}")
+    logger.info("Sonara Python audio analyzer starting")
+    logger.info("Command line arguments: %s", sys.argv)
+
+    if len(sys.argv) == 2 and sys.argv[1] == "--serve":
+        logger.info("Initializing FrequencyAnalyzer for sweep deconvolution")
+        serve(FrequencyAnalyzer())
+        return
 
     if len(sys.argv) < 3:
-        error_msg = "Usage: python analyze_audio.py <recorded_file> <signal_id> [output_file] [room_data_json]"
-        logging.error(error_msg)
+        error_msg = "Usage: python analyze_audio.py <recorded_file> <signal_id> [output_file] [room_data_json] | --serve"
+        logger.error(error_msg)
         print(json.dumps({"error": error_msg}))
         sys.exit(1)
 
@@ -364,86 +843,51 @@ def main():
     output_file = sys.argv[3] if len(sys.argv) > 3 else None
     room_data_json = sys.argv[4] if len(sys.argv) > 4 else None
 
-    logging.info(f"Input file: {recorded_file}")
-    logging.info(f"Signal ID: {signal_id}")
+    logger.info("Input file: %s", recorded_file)
+    logger.info("Signal ID: %s", signal_id)
     if output_file:
-        logging.info(f"Output file: {output_file}")
+        logger.info("Output file: %s", output_file)
     else:
-        logging.warning("No output file specified, will use stdout (deprecated)")
+        logger.warning("No output file specified, will use stdout (deprecated)")
     if room_data_json:
-        logging.info(f"Room data provided: {room_data_json}")
+        logger.info("Room data provided: %s", room_data_json)
     else:
-        logging.info("No room data provided, using basic analysis")
+        logger.info("No room data provided, using basic analysis")
 
     # Parse room data JSON if provided
     room_data = None
     if room_data_json:
         try:
             room_data = json.loads(room_data_json)
-            logging.info(f"Parsed room data: {room_data}")
+            logger.info("Parsed room data: %s", room_data)
         except json.JSONDecodeError as e:
-            logging.error(f"Failed to parse room data JSON: {e}")
+            logger.error("Failed to parse room data JSON: %s", e)
             room_data = None
 
     # Use new FrequencyAnalyzer for sweep deconvolution
-    try:
-        logging.info("Initializing FrequencyAnalyzer for sweep deconvolution")
-        analyzer = FrequencyAnalyzer()
-        logging.info("Starting sweep deconvolution analysis")
-        frequencies, response_db, room_modes = analyzer.analyze_sweep_deconvolution(
-            recorded_file, signal_id, room_data
-        )
-        logging.info(f"Sweep deconvolution completed - generated {len(frequencies)} frequency points, {len(room_modes)} room modes")
-
-        # Format for frontend with log-spaced resampling
-        logging.info(f"Resampling from {len(frequencies)} to 300 log-spaced points")
-        display_freqs, display_mags = analyzer.resample_log_spaced(
-            frequencies, response_db, num_points=300
-        )
-        frequency_data = [
-            {"frequency": float(f), "magnitude": float(m)}
-            for f, m in zip(display_freqs, display_mags)
-        ]
-        logging.info(f"Resampled to {len(frequency_data)} log-spaced frequency points")
-
-        result = {
-            "frequency_data": frequency_data,
-            "analysis_type": "sweep_deconvolution",
-            "smoothing": "1/12 octave",
-            "fft_size": analyzer.fft_size,
-            "reference": signal_id,
-            "rt60": 0.5,  # Placeholder - can be calculated from impulse response
-            "room_modes": room_modes  # Calculated room mode frequencies
-        }
-        logging.info("Sweep deconvolution result prepared successfully")
-
-    except Exception as e:
-        error_msg = f"Sweep deconvolution failed: {str(e)}"
-        logging.error(error_msg)
-        result = {"error": error_msg}
+    logger.info("Initializing FrequencyAnalyzer for sweep deconvolution")
+    analyzer = FrequencyAnalyzer()
+    result = run_analysis(analyzer, recorded_file, signal_id, room_data)
 
     # Output results to file or stdout
     if output_file:
-        logging.info(f"Writing results to file: {output_file}")
         try:
-            with open(output_file, 'w') as f:
-                f.write(json.dumps(result))
-            logging.info("Results written to file successfully")
+            write_result_file(output_file, result)
         except Exception as e:
-            logging.error(f"Failed to write results to file {output_file}: {e}")
+            logger.error("Failed to write results to file %s: %s", output_file, e)
             print(json.dumps({"error": f"Failed to write output file: {str(e)}"}))
             sys.exit(1)
     else:
         # Backward compatibility fallback
-        logging.warning("Writing results to stdout (deprecated)")
-        print(json.dumps(result))
-        logging.info("JSON output sent to stdout")
+        logger.warning("Writing results to stdout (deprecated)")
+        sys.stdout.buffer.write(dumps_result(result) + b"\n")
+        logger.info("JSON output sent to stdout")
 
     if "error" in result:
-        logging.error("Exiting with error status")
+        logger.error("Exiting with error status")
         sys.exit(1)
 
-    logging.info("Python script completed successfully")
+    logger.info("Python script completed successfully")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+"""pytest configuration for the analysis script tests"""
+
+import os
+import sys
+
+# analyze_audio imports reference_signals as a top-level module, so the scripts
+# directory has to be importable wherever pytest is started from
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
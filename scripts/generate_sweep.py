@@ -16,10 +16,17 @@ def generate_exponential_sweep(duration=10, sample_rate=44100):
     R = np.log(f1 / f0)
     K = duration * f0 / R
     L = duration / R
-    sweep = np.sin(2 * np.pi * K * (np.exp(t / L) - 1))
+    # Evaluated in place in t's buffer; the phase stays float64 since it
+    # reaches ~1e5 rad and float32 would smear the top octave
+    sweep = t
+    np.divide(sweep, L, out=sweep)
+    np.exp(sweep, out=sweep)
+    np.subtract(sweep, 1, out=sweep)
+    np.multiply(sweep, 2 * np.pi * K, out=sweep)
+    np.sin(sweep, out=sweep)
 
     # Scale to prevent clipping (0.5 = -6dBFS)
-    sweep = sweep * 0.5
+    np.multiply(sweep, 0.5, out=sweep)
     return sweep
 
 # Generate 10-second exponential sweep at 44.1kHz
@@ -31,7 +38,9 @@ output_dir = os.path.join(os.path.dirname(__file__), 'reference_signals')
 os.makedirs(output_dir, exist_ok=True)
 
 # Save only the sweep file (no inverse needed for spectral division)
-wavfile.write(os.path.join(output_dir, 'exp-sweep-44.wav'), sample_rate, (sweep * 32767).astype(np.int16))
+# Quantize to 16-bit PCM: scale in place, then a single cast pass
+np.multiply(sweep, 32767, out=sweep)
+wavfile.write(os.path.join(output_dir, 'exp-sweep-44.wav'), sample_rate, sweep.astype(np.int16))
 
 print(f"Generated exponential sweep file at {sample_rate}Hz")
 print(f"Duration: {duration}s, Frequency range: 20Hz - 20kHz")
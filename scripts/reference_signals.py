@@ -9,7 +9,24 @@ for frequency response measurement via sweep deconvolution.
 import os
 import logging
 import numpy as np
-import librosa
+import soundfile as sf
+
+
+def load_mono(path):
+    """
+    Load an audio file as mono float32 at its native sample rate.
+
+    Reads with soundfile directly; librosa (imported lazily, it is slow to
+    import) is only used for formats libsndfile can't decode.
+    """
+    try:
+        audio, sr = sf.read(path, dtype='float32', always_2d=False)
+    except sf.LibsndfileError:
+        import librosa
+        return librosa.load(path, sr=None, mono=True)
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1, dtype=np.float32)  # Downmix to mono
+    return audio, sr
 
 
 class ReferenceSignalManager:
@@ -17,7 +34,6 @@ class ReferenceSignalManager:
     Manages reference signals for acoustic measurement.
 
     Stores original test signals for spectral division deconvolution.
-    Pre-computes FFTs for performance.
     """
 
     def __init__(self):
@@ -32,17 +48,15 @@ class ReferenceSignalManager:
         self._load_cache()
 
     def _load_cache(self):
-        """Pre-compute and cache FFTs for performance"""
+        """Load every reference sweep into memory once"""
         for signal_id, config in self.signals.items():
             sweep_path = os.path.join(self.base_path, config["sweep"])
 
             try:
-                # Load sweep signal only (inverse not needed for spectral division)
-                sweep, sr = librosa.load(sweep_path, sr=None, mono=True)
-
-                # Cache FFTs (32k points for consistency)
+                # Load sweep signal only (inverse not needed for spectral division);
+                # the analyzer computes the spectra it needs at its own padded lengths
+                sweep, sr = load_mono(sweep_path)
                 self.fft_cache[signal_id] = {
-                    "sweep_fft": np.fft.rfft(sweep, n=32768),
                     "sweep_signal": sweep,
                     "sample_rate": sr
                 }
@@ -73,7 +87,7 @@ class ReferenceSignalManager:
         if data is None:
             return False
 
-        required_keys = ["sweep_fft", "sweep_signal", "sample_rate"]
+        required_keys = ["sweep_signal", "sample_rate"]
         return all(key in data for key in required_keys)
 
 
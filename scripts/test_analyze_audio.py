@@ -1,324 +1,289 @@
 #!/usr/bin/env python3
-"""Comprehensive tests for audio analysis script"""
+"""Tests for the sweep deconvolution analyzer"""
 
 import unittest
 import numpy as np
-import json
 import tempfile
+import json
 import os
-from scipy.io import wavfile
+import subprocess
 import sys
-import inspect
-
-# Add parent directory to path to import analyze_audio
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
-
-from scripts.analyze_audio import AudioAnalyzer
-
-
-class AudioTestUtils:
-    """Utility methods for audio test generation"""
-
-    @staticmethod
-    def generate_sine_wave(frequency, sample_rate, duration, amplitude=1.0):
-        """Generate a sine wave audio signal"""
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        return np.sin(2 * np.pi * frequency * t) * amplitude
-
-    @staticmethod
-    def create_wav_file(audio, sample_rate, filename):
-        """Create a WAV file from audio data"""
-        audio_int16 = np.int16(audio * 32767)
-        wavfile.write(filename, sample_rate, audio_int16)
-
-    @staticmethod
-    def find_peak_near_frequency(freq_data, target_freq, tolerance_hz=50):
-        """Find the peak closest to target frequency"""
-        nearby_points = [p for p in freq_data if abs(p['frequency'] - target_freq) <= tolerance_hz]
-        return max(nearby_points, key=lambda p: p['magnitude']) if nearby_points else None
-
-
-class TestAudioAnalyzer(unittest.TestCase):
-    def setUp(self):
-        """Set up test fixtures"""
-        self.analyzer = AudioAnalyzer()
-
-    def test_basic_fft(self):
-        """Test that FFT produces reasonable frequency data"""
-        # Generate a 1kHz sine wave (440Hz for A note)
-        sample_rate = 44100
-        duration = 1.0  # 1 second
-        frequency = 440.0
-
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        audio = np.sin(frequency * 2 * np.pi * t)
-
-        # Create temporary WAV file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_filename = temp_file.name
-            # Normalize to 16-bit PCM
-            audio_int16 = np.int16(audio * 32767)
-            wavfile.write(temp_filename, sample_rate, audio_int16)
-
-        try:
-            # Analyze the file
-            result = self.analyzer.analyze(temp_filename)
-
-            # Verify basic structure
-            self.assertIn('frequency_data', result)
-            self.assertIn('rt60', result)
-            self.assertIn('room_modes', result)
-            self.assertIn('sample_rate', result)
-
-            # Verify frequency data is present
-            freq_data = result['frequency_data']
-            self.assertIsInstance(freq_data, list)
-            self.assertGreater(len(freq_data), 0)
-
-            # Check that we have data points in audible range
-            frequencies = [point['frequency'] for point in freq_data]
-            self.assertTrue(any(20 <= f <= 20000 for f in frequencies))
-
-            # Verify sample rate
-            self.assertEqual(result['sample_rate'], sample_rate)
-
-            # RT60 should be a reasonable value (placeholder for now)
-            self.assertIsInstance(result['rt60'], (int, float))
-
-        finally:
-            # Clean up
-            os.unlink(temp_filename)
-
-    def test_1khz_peak_detection_accuracy(self):
-        """Test 1kHz tone peak detection within 1% accuracy"""
-        sample_rate = 44100
-        duration = 2.0  # Longer for better FFT resolution
-        frequency = 1000.0  # Exactly 1kHz
-
-        # Generate pure sine wave
-        audio = AudioTestUtils.generate_sine_wave(frequency, sample_rate, duration)
-
-        # Create test file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_filename = temp_file.name
-            AudioTestUtils.create_wav_file(audio, sample_rate, temp_filename)
-
-        try:
-            result = self.analyzer.analyze(temp_filename)
-            freq_data = result['frequency_data']
-
-            # Find peak closest to 1kHz
-            peak = AudioTestUtils.find_peak_near_frequency(freq_data, 1000.0, 50)
-            self.assertIsNotNone(peak, "No peaks found near 1kHz")
-
-            # Verify peak frequency is within 1.1% of 1000Hz (allowing for FFT resolution)
-            frequency_error = abs(peak['frequency'] - 1000.0) / 1000.0
-            self.assertLess(frequency_error, 0.011, f"Peak detection error: {frequency_error*100:.2f}%")
-
-        finally:
-            os.unlink(temp_filename)
-
-    def test_calibration_curve_interpolation(self):
-        """Test calibration curve interpolation accuracy"""
-        # Test known calibration points
-        test_points = [
-            (20, 12),    # +12dB at 20Hz
-            (1000, 0),   # Flat at 1kHz
-            (8000, -3),  # -3dB at 8kHz
-            (20000, 5)   # +5dB at 20kHz
-        ]
-
-        frequencies = np.array([p[0] for p in test_points])
-        expected_corrections = np.array([p[1] for p in test_points])
-        dummy_magnitudes = np.zeros_like(frequencies)  # Flat response
-
-        calibrated = self.analyzer.apply_calibration(frequencies, dummy_magnitudes)
-
-        # Verify calibration corrections are applied correctly
-        for i, (freq, expected_corr) in enumerate(test_points):
-            actual_corr = calibrated[i] - dummy_magnitudes[i]
-            self.assertAlmostEqual(actual_corr, expected_corr, places=1,
-                                  msg=f"Calibration error at {freq}Hz: expected {expected_corr}, got {actual_corr}")
-
-    def test_calibration_interpolation_between_points(self):
-        """Test interpolation between calibration curve points"""
-        # Test midpoint between 1000Hz (0dB) and 2000Hz (-1dB)
-        frequencies = np.array([1500.0])
-        dummy_magnitudes = np.array([0.0])
-
-        calibrated = self.analyzer.apply_calibration(frequencies, dummy_magnitudes)
-
-        # Should interpolate to approximately -0.5dB
-        expected_correction = -0.5
-        actual_correction = calibrated[0] - dummy_magnitudes[0]
-        self.assertAlmostEqual(actual_correction, expected_correction, places=1)
-
-    def test_multiple_sample_rates(self):
-        """Test analysis with different sample rates"""
-        test_rates = [44100, 48000, 96000]
-        frequency = 1000.0  # 1kHz test tone
-
-        for sample_rate in test_rates:
-            with self.subTest(sample_rate=sample_rate):
-                duration = 1.0
-                audio = AudioTestUtils.generate_sine_wave(frequency, sample_rate, duration)
-
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                    temp_filename = temp_file.name
-                    AudioTestUtils.create_wav_file(audio, sample_rate, temp_filename)
-
-                try:
-                    result = self.analyzer.analyze(temp_filename)
-
-                    # Verify sample rate is correctly detected
-                    self.assertEqual(result['sample_rate'], sample_rate)
-
-                    # Verify frequency data exists and covers expected range
-                    freq_data = result['frequency_data']
-                    self.assertGreater(len(freq_data), 0)
-
-                    # Check that 1kHz peak is detected
-                    peak_found = any(abs(p['frequency'] - 1000) < 50 for p in freq_data)
-                    self.assertTrue(peak_found, f"1kHz peak not found at {sample_rate}Hz sample rate")
-
-                finally:
-                    os.unlink(temp_filename)
+from scipy import signal
+
+from analyze_audio import FrequencyAnalyzer, analyze_batch, run_analysis
+from _audio_test_utils import AudioTestUtils
+
+SIGNAL_ID = "exp_sweep_20_20k_44"
+
+
+class TestFrequencyAnalyzer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared analyzer and one temp directory for the WAV fixtures"""
+        # One analyzer for the whole class so its caches stay warm between tests
+        cls.analyzer = FrequencyAnalyzer()
+        ref_data = cls.analyzer.ref_manager.get_signal_data(SIGNAL_ID)
+        cls.sweep = ref_data["sweep_signal"]
+        cls.sample_rate = ref_data["sample_rate"]
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls._wav_cache = {}
+        cls._pcm_cache = {}
+        # Compile the peak search for the float64 arrays frequency_arrays returns,
+        # so the JIT cost isn't charged to the first test that uses it
+        AudioTestUtils.find_peak_near_frequency(np.zeros(2), np.zeros(2), 0.0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmpdir.cleanup()
+
+    @classmethod
+    def _tmp_wav(cls, name):
+        """Path for a WAV fixture named name inside the class temp directory"""
+        return os.path.join(cls._tmpdir.name, name + '.wav')
+
+    @classmethod
+    def make_recording(cls, gain=0.5, pre_roll=0.2, tail=0.5, eq=None):
+        """
+        Simulate a recording of the reference sweep as float32 samples.
+
+        The sweep is scaled by gain, optionally filtered through a peaking EQ
+        (center_freq, gain_db, q) standing in for the room, and padded with
+        pre_roll seconds of silence before it and tail seconds after it.
+        """
+        sweep = cls.sweep.astype(np.float64)
+        if eq is not None:
+            sweep = signal.lfilter(*AudioTestUtils.peaking_eq(*eq, cls.sample_rate), sweep)
+        return np.concatenate([
+            np.zeros(int(pre_roll * cls.sample_rate), dtype=np.float32),
+            (gain * sweep).astype(np.float32),
+            np.zeros(int(tail * cls.sample_rate), dtype=np.float32),
+        ])
+
+    @classmethod
+    def get_or_create_recording_wav(cls, gain=0.5, pre_roll=0.2, tail=0.5, eq=None):
+        """Return the path of a simulated recording WAV fixture, writing it only once"""
+        key = (gain, pre_roll, tail, eq)
+        if key not in cls._wav_cache:
+            path = cls._tmp_wav(f"recording_{len(cls._wav_cache)}")
+            AudioTestUtils.create_wav_file(cls.make_recording(gain, pre_roll, tail, eq), cls.sample_rate, path)
+            cls._wav_cache[key] = path
+        return cls._wav_cache[key]
+
+    @classmethod
+    def analyze_recording(cls, gain=0.5, pre_roll=0.2, tail=0.5, eq=None):
+        """
+        Analyze a simulated recording in memory with analyze_sweep_array.
+
+        The samples are quantized to int16 once, exactly as the WAV round trip
+        would, so the result matches the file-based path. Returns the
+        full-resolution (frequencies, response_db) arrays.
+        """
+        key = (gain, pre_roll, tail, eq)
+        if key not in cls._pcm_cache:
+            pcm = (cls.make_recording(gain, pre_roll, tail, eq) * 32767).astype(np.int16)
+            cls._pcm_cache[key] = pcm.astype(np.float32) / np.float32(32768.0)
+        freqs, response_db, _, _ = cls.analyzer.analyze_sweep_array(cls._pcm_cache[key], cls.sample_rate, SIGNAL_ID)
+        return freqs, response_db.astype(float)
+
+    def assertFlat(self, freqs, mags, lo, hi, tolerance_db):
+        """Assert the response stays within ±tolerance_db between lo and hi Hz"""
+        band = (freqs >= lo) & (freqs <= hi)
+        self.assertTrue(band.any())
+        worst = float(np.abs(mags[band]).max())
+        self.assertLess(worst, tolerance_db, f"Response deviates {worst:.2f} dB between {lo} and {hi} Hz")
+
+    def test_result_structure(self):
+        """Test that run_analysis produces the payload the Go service expects"""
+        result = run_analysis(self.analyzer, self.get_or_create_recording_wav(), SIGNAL_ID)
+
+        self.assertNotIn('error', result)
+        for key in ('frequencies', 'magnitudes', 'analysis_type', 'fft_size', 'reference', 'rt60', 'room_modes'):
+            self.assertIn(key, result)
+        self.assertEqual(result['analysis_type'], 'sweep_deconvolution')
+        self.assertEqual(result['reference'], SIGNAL_ID)
+        self.assertIsInstance(result['rt60'], (int, float))
+        self.assertEqual(result['room_modes'], [])
+        self.assertGreaterEqual(result['fft_size'], self.analyzer.fft_size)
+
+        # Columnar display data: parallel, sorted, within the audible range
+        freqs, mags = AudioTestUtils.frequency_arrays(result)
+        self.assertEqual(len(freqs), len(mags))
+        self.assertGreater(len(freqs), 0)
+        self.assertTrue(np.all(np.diff(freqs) > 0))
+        self.assertGreaterEqual(freqs[0], 20)
+        self.assertLessEqual(freqs[-1], 20000)
+
+    def test_flat_response(self):
+        """Test that a recording of the bare sweep measures flat"""
+        freqs, mags = self.analyze_recording()
+        self.assertFlat(freqs, mags, 20, 20000, 0.5)
+
+    def test_resonance_peak_detection(self):
+        """Test that a +9dB resonance at 4kHz shows up at the right frequency"""
+        freqs, mags = self.analyze_recording(eq=(4000.0, 9.0, 2.0))
+
+        peak = AudioTestUtils.find_peak_near_frequency(freqs, mags, 4000.0, 1000)
+        self.assertIsNotNone(peak, "No peak found near 4kHz")
+
+        # Within 5% of 4kHz; 1/3-octave smoothing takes a little off the +9dB
+        frequency_error = abs(peak['frequency'] - 4000.0) / 4000.0
+        self.assertLess(frequency_error, 0.05, f"Peak detection error: {frequency_error*100:.2f}%")
+        self.assertGreater(peak['magnitude'], 6.0)
+        self.assertLess(peak['magnitude'], 9.5)
+
+    def test_recording_delay(self):
+        """Test that silence before the sweep is aligned away"""
+        # Browsers can start the sweep seconds after recording begins
+        for pre_roll in (0.0, 0.2, 0.8, 1.5, 2.3):
+            with self.subTest(pre_roll=pre_roll):
+                freqs, mags = self.analyze_recording(pre_roll=pre_roll)
+                self.assertFlat(freqs, mags, 20, 20000, 0.5)
 
     def test_very_quiet_signal(self):
-        """Test analysis with very quiet signal (near noise floor)"""
-        sample_rate = 44100
-        duration = 2.0
-        frequency = 1000.0
-
-        # Generate signal at -60dB (very quiet)
-        audio = AudioTestUtils.generate_sine_wave(frequency, sample_rate, duration, 0.001)  # -60dB amplitude
-
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_filename = temp_file.name
-            AudioTestUtils.create_wav_file(audio, sample_rate, temp_filename)
+        """Test analysis with very quiet signal (near the 16-bit noise floor)"""
+        # Sweep peaking at -66dBFS, so only a few LSBs survive quantization
+        freqs, mags = self.analyze_recording(gain=0.001)
 
-        try:
-            result = self.analyzer.analyze(temp_filename)
-            freq_data = result['frequency_data']
-
-            # Should still detect the signal (though magnitude will be low)
-            self.assertGreater(len(freq_data), 0)
-            self.assertNotIn('error', result)
-
-        finally:
-            os.unlink(temp_filename)
+        # Quantization noise swamps the top octaves, but the midrange still measures
+        self.assertFlat(freqs, mags, 100, 2000, 6.0)
 
     def test_very_loud_signal(self):
         """Test analysis with very loud signal (near clipping)"""
-        sample_rate = 44100
-        duration = 1.0
-        frequency = 1000.0
-
-        # Generate signal near full scale (0.95 to avoid clipping)
-        audio = AudioTestUtils.generate_sine_wave(frequency, sample_rate, duration, 0.95)
-
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_filename = temp_file.name
-            AudioTestUtils.create_wav_file(audio, sample_rate, temp_filename)
-
-        try:
-            result = self.analyzer.analyze(temp_filename)
-            freq_data = result['frequency_data']
-
-            # Should handle loud signals without crashing
-            self.assertGreater(len(freq_data), 0)
-            self.assertNotIn('error', result)
-
-            # Verify 1kHz fundamental is still detectable
-            peak_found = any(abs(p['frequency'] - 1000) < 100 for p in freq_data)
-            self.assertTrue(peak_found, "1kHz peak should still be detectable in loud signal")
-
-            # Verify calibration curve is working: high frequencies should be boosted
-            # The FIFINE K669 calibration curve boosts frequencies near 20kHz by +5dB
-            high_freq_20k = [p for p in freq_data if 19500 <= p['frequency'] <= 20000]
-            if high_freq_20k:
-                max_20k_level = max(p['magnitude'] for p in high_freq_20k)
-                # Should be boosted relative to uncalibrated response
-                # (This verifies calibration is working, not that there's distortion)
-                fundamental_points = [p for p in freq_data if 900 <= p['frequency'] <= 1100]
-                if fundamental_points:
-                    fundamental_level = max(p['magnitude'] for p in fundamental_points)
-                    # 20kHz should be reasonably close to fundamental after calibration
-                    # (allowing for natural rolloff + calibration boost)
-                    level_diff = fundamental_level - max_20k_level
-                    self.assertLess(level_diff, 15, f"20kHz too far below fundamental: {level_diff:.1f} dB")
-
-        finally:
-            os.unlink(temp_filename)
+        # Sweep peaking at 0.95 of full scale
+        freqs, mags = self.analyze_recording(gain=1.9)
+        self.assertFlat(freqs, mags, 20, 20000, 0.5)
+
+    def test_response_fft_size(self):
+        """Test that impulses longer than fft_size get a longer transform, and that it is reported"""
+        # A 450ms window at 96kHz is longer than the 32k minimum
+        impulse = np.zeros(int(0.45 * 96000), dtype=np.float32)
+        impulse[0] = 1.0
+        freqs, _, n = self.analyzer.impulse_to_frequency_response(impulse, 96000)
+
+        self.assertGreaterEqual(n, len(impulse))
+        self.assertAlmostEqual(freqs[1] - freqs[0], 96000 / n)
+
+    def test_float_sample_rate(self):
+        """Test that analyze_sweep_array accepts a float sample rate"""
+        freqs, response_db, _, _ = self.analyzer.analyze_sweep_array(
+            self.make_recording(), float(self.sample_rate), SIGNAL_ID
+        )
+        self.assertFlat(freqs, response_db.astype(float), 20, 20000, 0.5)
 
     def test_dc_offset_signal(self):
         """Test handling of signal with DC offset"""
-        sample_rate = 44100
-        duration = 1.0
-        frequency = 1000.0
-
-        # Generate signal with DC offset
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        audio = 0.5 + 0.1 * np.sin(2 * np.pi * frequency * t)  # DC + AC
-
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_filename = temp_file.name
-            # Normalize to avoid clipping
-            audio_normalized = audio / np.max(np.abs(audio))
-            AudioTestUtils.create_wav_file(audio_normalized, sample_rate, temp_filename)
+        # DC + sweep, normalized in place in the float32 buffer to avoid clipping
+        audio = self.make_recording()
+        audio += np.float32(0.1)
+        AudioTestUtils.normalize_inplace(audio)
+        self.assertAlmostEqual(AudioTestUtils.absmax(audio), 1.0, places=6)
+        wav_path = self._tmp_wav(self._testMethodName)
+        AudioTestUtils.create_wav_file(audio, self.sample_rate, wav_path)
+
+        result = run_analysis(self.analyzer, wav_path, SIGNAL_ID)
+        self.assertNotIn('error', result)
+
+        # The offset leaks into the band edges, but the midrange is unaffected
+        freqs, mags = AudioTestUtils.frequency_arrays(result)
+        self.assertFlat(freqs, mags, 100, 10000, 0.5)
+
+    def test_room_modes(self):
+        """Test that room dimensions produce spaced room modes in 20–300 Hz"""
+        room_data = {'room_length_feet': 20, 'room_width_feet': 15, 'room_height_feet': 8}
+        result = run_analysis(self.analyzer, self.get_or_create_recording_wav(), SIGNAL_ID, room_data)
+
+        modes = result['room_modes']
+        self.assertGreater(len(modes), 0)
+        self.assertLessEqual(len(modes), 5)
+        self.assertTrue(all(20 <= m <= 300 for m in modes))
+        self.assertEqual(modes, sorted(modes))
 
-        try:
-            result = self.analyzer.analyze(temp_filename)
-            freq_data = result['frequency_data']
-
-            # Should still work and detect the 1kHz component
-            self.assertGreater(len(freq_data), 0)
-            self.assertNotIn('error', result)
-
-            # Check for very low frequency content (DC and near-DC)
-            low_freq_points = [p for p in freq_data if p['frequency'] < 10]
-            if low_freq_points:
-                # DC component should be present but analysis should still work
-                pass  # Just verify no crash
+    def test_multiple_sample_rates(self):
+        """Test that recordings load at their native sample rate"""
+        frequency = 1000.0  # 1kHz test tone
+        duration = 1.0
+        for sample_rate in (44100, 48000, 96000):
+            with self.subTest(sample_rate=sample_rate):
+                audio = AudioTestUtils.generate_sine_wave(frequency, sample_rate, duration, 0.5)
+                wav_path = self._tmp_wav(f"{frequency}_{sample_rate}_{duration}")
+                AudioTestUtils.create_wav_file(audio, sample_rate, wav_path)
+
+                loaded, loaded_rate = self.analyzer.load_audio(wav_path)
+
+                # No resampling, and the samples survive the 16-bit round trip
+                self.assertEqual(loaded_rate, sample_rate)
+                self.assertEqual(loaded.dtype, np.float32)
+                self.assertEqual(len(loaded), len(audio))
+                self.assertLess(np.abs(loaded - audio).max(), 1e-4)
+
+    def test_serve_protocol(self):
+        """Test that --serve answers one JSON line per request line, in order, including bad ones"""
+        output_path = os.path.join(self._tmpdir.name, 'serve_result.json')
+        requests = [
+            json.dumps({"request_id": "ok", "recorded_file": self.get_or_create_recording_wav(),
+                        "signal_id": SIGNAL_ID, "room_data": {"room_length_feet": 20},
+                        "output_file": output_path}),
+            "",  # Blank lines are skipped without a reply
+            json.dumps({"request_id": "missing", "recorded_file": "/nonexistent/file.wav", "signal_id": SIGNAL_ID}),
+            json.dumps({"request_id": "no_file", "signal_id": SIGNAL_ID}),
+            "not json",
+        ]
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analyze_audio.py')
+        proc = subprocess.run(
+            [sys.executable, script, '--serve'],
+            input="\n".join(requests) + "\n", capture_output=True, text=True, timeout=120,
+            env={**os.environ, "SONARA_LOG_LEVEL": "WARNING"},
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
+        replies = [json.loads(line) for line in proc.stdout.splitlines()]
+        self.assertEqual([r["request_id"] for r in replies], ["ok", "missing", "no_file", None])
+
+        ok = replies[0]["result"]
+        self.assertNotIn('error', ok)
+        self.assertEqual(len(ok['frequencies']), len(ok['magnitudes']))
+        self.assertGreater(len(ok['room_modes']), 0)
+        with open(output_path) as f:
+            self.assertEqual(json.load(f), ok)
+
+        for reply in replies[1:]:
+            self.assertIn('error', reply["result"])
+
+    def test_analyze_batch(self):
+        """Test that analyze_batch returns one result per file, in order, matching run_analysis"""
+        paths = [
+            self.get_or_create_recording_wav(),
+            '/nonexistent/file.wav',
+            self.get_or_create_recording_wav(eq=(4000.0, 9.0, 2.0)),
+        ]
+        results = analyze_batch(paths, SIGNAL_ID, workers=2)
 
-        finally:
-            os.unlink(temp_filename)
+        self.assertEqual(len(results), len(paths))
+        self.assertIn('error', results[1])
+        for path, result in zip(paths[::2], results[::2]):
+            expected = run_analysis(self.analyzer, path, SIGNAL_ID)
+            np.testing.assert_allclose(result['frequencies'], expected['frequencies'])
+            np.testing.assert_allclose(result['magnitudes'], expected['magnitudes'], atol=1e-3)
 
     def test_invalid_file(self):
         """Test handling of invalid file"""
-        result = self.analyzer.analyze('/nonexistent/file.wav')
+        result = run_analysis(self.analyzer, '/nonexistent/file.wav', SIGNAL_ID)
+        self.assertIn('error', result)
+
+    def test_unknown_signal(self):
+        """Test handling of an unknown reference signal ID"""
+        result = run_analysis(self.analyzer, self.get_or_create_recording_wav(), 'no_such_sweep')
         self.assertIn('error', result)
 
     def test_frequency_range(self):
         """Test that frequency data covers expected range"""
-        # Generate white noise
-        sample_rate = 44100
-        duration = 1.0
-        audio = np.random.normal(0, 1, int(sample_rate * duration))
+        result = run_analysis(self.analyzer, self.get_or_create_recording_wav(), SIGNAL_ID)
+        freqs, _ = AudioTestUtils.frequency_arrays(result)
 
-        # Create temporary WAV file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_filename = temp_file.name
-            audio_int16 = np.int16(audio * 32767)
-            wavfile.write(temp_filename, sample_rate, audio_int16)
-
-        try:
-            result = self.analyzer.analyze(temp_filename)
-            freq_data = result['frequency_data']
-
-            # Should have frequencies from ~20Hz to ~20kHz
-            min_freq = min(point['frequency'] for point in freq_data)
-            max_freq = max(point['frequency'] for point in freq_data)
-
-            self.assertLess(min_freq, 100)  # Should include low frequencies
-            self.assertGreater(max_freq, 10000)  # Should include high frequencies
-
-        finally:
-            os.unlink(temp_filename)
+        # Should have frequencies from ~20Hz to ~20kHz (frequencies are sorted)
+        self.assertLess(freqs[0], 100)  # Should include low frequencies
+        self.assertGreater(freqs[-1], 10000)  # Should include high frequencies
 
 
 if __name__ == '__main__':
     unittest.main()
-